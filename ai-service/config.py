@@ -2,8 +2,10 @@
 ANANYA-AI Configuration Settings
 Privacy-first configuration for AI services
 """
+from functools import lru_cache
+from pydantic import Field
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -15,7 +17,9 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     
     # CORS (Backend will proxy, but allow direct access for dev)
-    ALLOWED_ORIGINS: list = ["http://localhost:3000", "http://localhost:5173"]
+    ALLOWED_ORIGINS: List[str] = Field(
+        default_factory=lambda: ["http://localhost:3000", "http://localhost:5173"]
+    )
     
     # Bias Detection Thresholds
     COMPLEXITY_THRESHOLD_HIGH: float = 12.0  # Flesch-Kincaid grade level
@@ -35,4 +39,16 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the cached application settings.
+    
+    The .env file is read and validated once per process; every later
+    call returns the same instance. Tests can override this dependency
+    via ``app.dependency_overrides[get_settings]``.
+    """
+    return Settings()
+
+
+settings = get_settings()
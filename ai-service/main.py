@@ -6,20 +6,27 @@ Port: 8002 (as per TECH_STACK.md)
 
 Endpoints:
 - POST /analyze-interaction - Extract response patterns
+- POST /analyze-interactions-batch - Extract patterns for many interactions
 - POST /detect-bias - Identify unfair complexity  
+- POST /detect-bias-batch - Identify unfair complexity for many requests
 - POST /generate-adaptation - Adjust explanations
+- POST /generate-adaptation-batch - Adjust explanations for many requests
 
 PRIVACY ENFORCEMENT:
 - No user identifiers accepted in any endpoint
 - All processing is stateless
 - Deterministic output for auditability
 """
-from fastapi import FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+import asyncio
 import logging
 import sys
+import time
 
 # Configure logging
 logging.basicConfig(
@@ -30,35 +37,54 @@ logging.basicConfig(
 logger = logging.getLogger("ananya-ai")
 
 # Import configuration
-from config import settings
+from config import Settings, get_settings, settings
 
 # Import models
 from models.schemas import (
     InteractionData,
+    InteractionBatch,
     InteractionAnalysisResult,
     BiasDetectionRequest,
+    BiasDetectionBatch,
     BiasDetectionResult,
     AdaptationRequest,
+    AdaptationBatch,
     AdaptationResult,
+    ContentRequest,
+    ContentAnalysisResult,
+    SimplifyRequest,
+    SimplificationResult,
 )
 
 # Import core modules
 from modules.bias_detector import BiasDetector
 from modules.adaptive_engine import AdaptiveEngine
 from modules.interaction_analyzer import InteractionAnalyzer
+from utils.text_analysis import TextAnalyzer
 
 
-# Initialize AI modules
-bias_detector = BiasDetector()
-adaptive_engine = AdaptiveEngine()
-interaction_analyzer = InteractionAnalyzer()
+# AI modules (constructed during application startup, see lifespan)
+bias_detector: Optional[BiasDetector] = None
+adaptive_engine: Optional[AdaptiveEngine] = None
+interaction_analyzer: Optional[InteractionAnalyzer] = None
+text_analyzer: Optional[TextAnalyzer] = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
+    global bias_detector, adaptive_engine, interaction_analyzer, text_analyzer
+    
     logger.info("🚀 ANANYA-AI Service starting...")
-    logger.info(f"📍 Running on port {settings.API_PORT}")
+    logger.info("📍 Running on port %s", settings.API_PORT)
+    
+    # Initialize AI modules off the event loop, after worker fork
+    bias_detector, adaptive_engine, interaction_analyzer, text_analyzer = await asyncio.gather(
+        asyncio.to_thread(BiasDetector),
+        asyncio.to_thread(AdaptiveEngine),
+        asyncio.to_thread(InteractionAnalyzer),
+        asyncio.to_thread(TextAnalyzer),
+    )
     logger.info("✅ Bias Detector initialized")
     logger.info("✅ Adaptive Engine initialized")
     logger.info("✅ Interaction Analyzer initialized")
@@ -90,6 +116,23 @@ app.add_middleware(
 
 # ============== Health Check ==============
 
+# Health probes can arrive many times per second; the timestamp is only
+# re-formatted when the wall-clock second changes.
+_last_ts_sec: int = 0
+_last_ts_str: str = ""
+
+
+def _health_timestamp() -> str:
+    """Return the current UTC time (1 second resolution) in ISO format."""
+    global _last_ts_sec, _last_ts_str
+    
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_sec = now
+        _last_ts_str = datetime.utcfromtimestamp(now).isoformat()
+    return _last_ts_str
+
+
 @app.get("/", tags=["Health"])
 async def root():
     """Root endpoint - health check."""
@@ -97,13 +140,13 @@ async def root():
         "service": "ANANYA-AI",
         "status": "healthy",
         "version": "1.0.0",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _health_timestamp(),
         "privacy_mode": "enabled"
     }
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check(app_settings: Settings = Depends(get_settings)):
     """Detailed health check for monitoring."""
     return {
         "status": "healthy",
@@ -113,9 +156,9 @@ async def health_check():
             "interaction_analyzer": "operational"
         },
         "configuration": {
-            "complexity_threshold_high": settings.COMPLEXITY_THRESHOLD_HIGH,
-            "complexity_threshold_medium": settings.COMPLEXITY_THRESHOLD_MEDIUM,
-            "log_user_identifiers": settings.LOG_USER_IDENTIFIERS  # Should be False
+            "complexity_threshold_high": app_settings.COMPLEXITY_THRESHOLD_HIGH,
+            "complexity_threshold_medium": app_settings.COMPLEXITY_THRESHOLD_MEDIUM,
+            "log_user_identifiers": app_settings.LOG_USER_IDENTIFIERS  # Should be False
         }
     }
 
@@ -142,25 +185,64 @@ async def analyze_interaction(interaction: InteractionData):
     **Privacy Guarantee**: No user identifiers processed or stored.
     """
     try:
-        logger.info(f"Analyzing interaction for session: {interaction.session_hash[:8]}...")
+        logger.info("Analyzing interaction for session: %s...", interaction.session_hash[:8])
         
-        result = interaction_analyzer.analyze_single_interaction(interaction)
+        result = await asyncio.to_thread(
+            interaction_analyzer.analyze_single_interaction, interaction
+        )
         
         logger.info(
-            f"Analysis complete. Pattern: {result.response_pattern}, "
-            f"Requires adaptation: {result.requires_adaptation}"
+            "Analysis complete. Pattern: %s, Requires adaptation: %s",
+            result.response_pattern,
+            result.requires_adaptation,
         )
         
         return result
         
     except Exception as e:
-        logger.error(f"Error analyzing interaction: {str(e)}")
+        logger.error("Error analyzing interaction: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to analyze interaction. Please try again."
         )
 
 
+@app.post(
+    "/analyze-interactions-batch",
+    response_model=List[InteractionAnalysisResult],
+    tags=["AI Core"],
+    summary="Analyze a batch of interactions",
+    description="Analyze up to 5000 anonymized interactions in one request. No user profiling."
+)
+async def analyze_interactions_batch(batch: InteractionBatch):
+    """
+    Analyze multiple learning interactions in a single call.
+    
+    Each interaction is analyzed independently, exactly as in
+    `/analyze-interaction`; results are returned in input order.
+    
+    **Privacy Guarantee**: No user identifiers processed or stored.
+    """
+    try:
+        logger.info("Analyzing batch of %d interaction(s)...", len(batch.items))
+        
+        results = await asyncio.to_thread(interaction_analyzer.analyze_batch, batch.items)
+        
+        logger.info(
+            "Batch analysis complete. %d require adaptation",
+            sum(1 for r in results if r.requires_adaptation),
+        )
+        
+        return results
+        
+    except Exception as e:
+        logger.error("Error analyzing interaction batch: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to analyze interactions. Please try again."
+        )
+
+
 @app.post(
     "/detect-bias",
     response_model=BiasDetectionResult,
@@ -184,14 +266,15 @@ async def detect_bias(request: BiasDetectionRequest):
     - No student labeling or profiling
     """
     try:
-        logger.info(f"Detecting bias for session: {request.session_hash[:8]}...")
+        logger.info("Detecting bias for session: %s...", request.session_hash[:8])
         
-        result = bias_detector.detect_bias(request)
+        result = await asyncio.to_thread(bias_detector.detect_bias, request)
         
         if result.bias_detected:
             logger.info(
-                f"Bias detected: {len(result.indicators)} indicator(s). "
-                f"Complexity level: {result.complexity_level}"
+                "Bias detected: %d indicator(s). Complexity level: %s",
+                len(result.indicators),
+                result.complexity_level,
             )
         else:
             logger.info("No significant bias detected.")
@@ -199,7 +282,44 @@ async def detect_bias(request: BiasDetectionRequest):
         return result
         
     except Exception as e:
-        logger.error(f"Error detecting bias: {str(e)}")
+        logger.error("Error detecting bias: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to detect bias. Please try again."
+        )
+
+
+@app.post(
+    "/detect-bias-batch",
+    response_model=List[BiasDetectionResult],
+    tags=["AI Core"],
+    summary="Detect bias for a batch of requests",
+    description="Analyze up to 500 content/interaction requests in one call without demographic inference."
+)
+async def detect_bias_batch(batch: BiasDetectionBatch):
+    """
+    Detect potential bias for multiple requests in a single call.
+    
+    Each request is analyzed independently, exactly as in
+    `/detect-bias`; results are returned in input order.
+    The whole batch runs in one worker thread.
+    
+    **Privacy Guarantee**: Works on interaction patterns only.
+    """
+    try:
+        logger.info("Detecting bias for batch of %d request(s)...", len(batch.items))
+        
+        results = await asyncio.to_thread(bias_detector.detect_bias_batch, batch.items)
+        
+        logger.info(
+            "Batch bias detection complete. %d with bias detected",
+            sum(1 for r in results if r.bias_detected),
+        )
+        
+        return results
+        
+    except Exception as e:
+        logger.error("Error detecting bias batch: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to detect bias. Please try again."
@@ -229,71 +349,157 @@ async def generate_adaptation(request: AdaptationRequest):
     - Deterministic output for auditability
     """
     try:
-        logger.info(
-            f"Generating adaptation for session: {request.session_hash[:8]}... "
-            f"Types: {[a.value for a in request.requested_adaptations]}"
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Generating adaptation for session: %s... Types: %s",
+                request.session_hash[:8],
+                [a.value for a in request.requested_adaptations],
+            )
+        
+        result = await asyncio.to_thread(adaptive_engine.generate_adaptation, request)
+        
+        if logger.isEnabledFor(logging.INFO):
+            primary = result.primary_recommendation
+            logger.info(
+                "Generated %d adaptation(s). Primary: %s",
+                len(result.adaptations),
+                primary.adaptation_type.value if primary else "None",
+            )
+        
+        return result
+        
+    except Exception as e:
+        logger.error("Error generating adaptation: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to generate adaptation. Please try again."
         )
+
+
+@app.post(
+    "/generate-adaptation-batch",
+    response_model=List[AdaptationResult],
+    tags=["AI Core"],
+    summary="Generate adapted explanations for a batch",
+    description="Process up to 500 adaptation requests in one call, based on interaction signals."
+)
+async def generate_adaptation_batch(batch: AdaptationBatch):
+    """
+    Generate adapted content for multiple requests in a single call.
+    
+    Each request is handled independently, exactly as in
+    `/generate-adaptation`; results are returned in input order.
+    The whole batch runs in one worker thread.
+    
+    **Privacy Guarantee**: Based on interaction signals, not user profiles.
+    """
+    try:
+        logger.info("Generating adaptations for batch of %d request(s)...", len(batch.items))
         
-        result = adaptive_engine.generate_adaptation(request)
+        results = await asyncio.to_thread(adaptive_engine.generate_adaptation_batch, batch.items)
         
         logger.info(
-            f"Generated {len(result.adaptations)} adaptation(s). "
-            f"Primary: {result.primary_recommendation.adaptation_type.value if result.primary_recommendation else 'None'}"
+            "Batch adaptation complete. %d adaptation(s) generated",
+            sum(len(r.adaptations) for r in results),
         )
         
-        return result
+        return results
         
     except Exception as e:
-        logger.error(f"Error generating adaptation: {str(e)}")
+        logger.error("Error generating adaptation batch: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to generate adaptation. Please try again."
+            detail="Failed to generate adaptations. Please try again."
         )
 
 
 # ============== Utility Endpoints ==============
 
+# Utility results are deterministic on their input, so identical content
+# (e.g. the same lesson served to many learners) is computed once.
+# Cached dicts are shared between requests and must be treated as read-only.
+# Texts above _UTILITY_CACHE_MAX_LENGTH are computed uncached so the
+# caches' memory stays bounded by entry count times this length.
+_UTILITY_CACHE_MAX_LENGTH = 20_000
+
+@lru_cache(maxsize=2048)
+def _analyze_content_cached(text: str) -> Dict[str, Any]:
+    """Compute readability analysis for a piece of content."""
+    readability = text_analyzer.get_readability_metrics(text)
+    
+    return {
+        "readability": readability,
+        "statistics": text_analyzer.get_text_statistics(text),
+        "complexity_level": text_analyzer.get_complexity_level(
+            readability.get("flesch_kincaid_grade", 0)
+        ),
+        "complex_words": text_analyzer.identify_complex_words(text)[:10],
+        "reading_time": text_analyzer.generate_reading_time_estimate(
+            text, metrics=readability
+        )
+    }
+
+
+@lru_cache(maxsize=2048)
+def _simplify_text_cached(text: str, level: str) -> Dict[str, Any]:
+    """Simplify content and report before/after grade levels."""
+    simplified = text_analyzer.simplify_text(text, level)
+    
+    return {
+        "original": text,
+        "simplified": simplified,
+        "level": level,
+        "original_grade": text_analyzer.get_grade_level(text),
+        "simplified_grade": text_analyzer.get_grade_level(simplified)
+    }
+
+
+def _analyze_content(text: str) -> Dict[str, Any]:
+    """Analyze content, caching the result only for moderately sized text."""
+    if len(text) > _UTILITY_CACHE_MAX_LENGTH:
+        return _analyze_content_cached.__wrapped__(text)
+    return _analyze_content_cached(text)
+
+
+def _simplify_text(text: str, level: str) -> Dict[str, Any]:
+    """Simplify content, caching the result only for moderately sized text."""
+    if len(text) > _UTILITY_CACHE_MAX_LENGTH:
+        return _simplify_text_cached.__wrapped__(text, level)
+    return _simplify_text_cached(text, level)
+
+
 @app.post(
     "/analyze-content",
+    response_model=ContentAnalysisResult,
     tags=["Utilities"],
     summary="Analyze content readability",
     description="Get readability metrics for academic content."
 )
-async def analyze_content(content: dict):
+async def analyze_content(content: ContentRequest):
     """
     Analyze content for readability metrics.
     
     Returns Flesch-Kincaid grade level, reading ease, and other metrics.
     """
-    from utils.text_analysis import TextAnalyzer
+    try:
+        return await asyncio.to_thread(_analyze_content, content.text)
     
-    text = content.get("text", "")
-    if not text:
+    except Exception as e:
+        logger.error("Error analyzing content: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Text content is required"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to analyze content. Please try again."
         )
-    
-    analyzer = TextAnalyzer()
-    
-    return {
-        "readability": analyzer.get_readability_metrics(text),
-        "statistics": analyzer.get_text_statistics(text),
-        "complexity_level": analyzer.get_complexity_level(
-            analyzer.get_readability_metrics(text).get("flesch_kincaid_grade", 0)
-        ),
-        "complex_words": analyzer.identify_complex_words(text)[:10],
-        "reading_time": analyzer.generate_reading_time_estimate(text)
-    }
 
 
 @app.post(
     "/simplify-text",
+    response_model=SimplificationResult,
     tags=["Utilities"],
     summary="Simplify text content",
     description="Apply text simplification without full adaptation flow."
 )
-async def simplify_text(request: dict):
+async def simplify_text(request: SimplifyRequest):
     """
     Quick text simplification utility.
     
@@ -301,30 +507,15 @@ async def simplify_text(request: dict):
         text: The text to simplify
         level: 'simple' or 'moderate' (default: moderate)
     """
-    from utils.text_analysis import TextAnalyzer
-    
-    text = request.get("text", "")
-    level = request.get("level", "moderate")
+    try:
+        return await asyncio.to_thread(_simplify_text, request.text, request.level)
     
-    if not text:
+    except Exception as e:
+        logger.error("Error simplifying text: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Text content is required"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to simplify text. Please try again."
         )
-    
-    if level not in ["simple", "moderate"]:
-        level = "moderate"
-    
-    analyzer = TextAnalyzer()
-    simplified = analyzer.simplify_text(text, level)
-    
-    return {
-        "original": text,
-        "simplified": simplified,
-        "level": level,
-        "original_grade": analyzer.get_readability_metrics(text).get("flesch_kincaid_grade", 0),
-        "simplified_grade": analyzer.get_readability_metrics(simplified).get("flesch_kincaid_grade", 0)
-    }
 
 
 # ============== Entry Point ==============
@@ -336,5 +527,8 @@ if __name__ == "__main__":
         "main:app",
         host=settings.API_HOST,
         port=settings.API_PORT,
+        # uvloop / httptools when installed (uvicorn[standard]), asyncio / h11 otherwise
+        loop="auto",
+        http="auto",
         reload=settings.DEBUG,
     )
@@ -1,18 +1,34 @@
 """ANANYA-AI Data Models"""
 from .schemas import (
     InteractionData,
+    InteractionBatch,
     InteractionAnalysisResult,
+    InteractionPatternBatch,
     BiasDetectionRequest,
+    BiasDetectionBatch,
     BiasDetectionResult,
     AdaptationRequest,
+    AdaptationBatch,
     AdaptationResult,
+    ContentRequest,
+    ContentAnalysisResult,
+    SimplifyRequest,
+    SimplificationResult,
 )
 
 __all__ = [
     "InteractionData",
+    "InteractionBatch",
     "InteractionAnalysisResult", 
+    "InteractionPatternBatch",
     "BiasDetectionRequest",
+    "BiasDetectionBatch",
     "BiasDetectionResult",
     "AdaptationRequest",
+    "AdaptationBatch",
     "AdaptationResult",
+    "ContentRequest",
+    "ContentAnalysisResult",
+    "SimplifyRequest",
+    "SimplificationResult",
 ]
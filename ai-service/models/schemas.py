@@ -7,8 +7,8 @@ PRIVACY NOTICE:
 - Only anonymized session data is processed
 - All requests are stateless
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Literal, Optional, Dict, Any
 from enum import Enum
 
 
@@ -50,7 +50,10 @@ class InteractionData(BaseModel):
     # Interaction metrics (no PII)
     response_time_ms: int = Field(..., ge=0, description="Time to respond in milliseconds")
     action_type: str = Field(..., description="Type of action: read, question, clarification")
-    content_text: Optional[str] = Field(None, description="The content being interacted with")
+    content_text_hash: Optional[str] = Field(
+        None,
+        description="Hash of the content being interacted with (send raw text to /analyze-content)"
+    )
     
     # Pattern indicators
     is_repeated_error: bool = Field(False, description="Whether this is a repeated error")
@@ -58,6 +61,17 @@ class InteractionData(BaseModel):
     time_on_content_seconds: int = Field(0, ge=0, description="Time spent on content")
 
 
+class InteractionBatch(BaseModel):
+    """
+    A batch of anonymized interactions analyzed in a single call.
+    Capped to keep per-request latency bounded.
+    """
+    items: List[InteractionData] = Field(
+        ..., min_length=1, max_length=5000,
+        description="Interactions to analyze (max 5000 per batch)"
+    )
+
+
 class InteractionAnalysisResult(BaseModel):
     """Result of analyzing interaction patterns."""
     session_hash: str
@@ -74,6 +88,40 @@ class InteractionAnalysisResult(BaseModel):
 
 # ============== Bias Detection ==============
 
+class InteractionPatternBatch(BaseModel):
+    """
+    Columnar (one list per metric) form of anonymized interaction patterns.
+    Entry i of every non-empty column describes the same interaction;
+    empty columns are treated as not reported.
+    """
+    response_times_ms: List[int] = Field(default_factory=list)
+    action_types: List[str] = Field(default_factory=list)
+    clarification_counts: List[int] = Field(default_factory=list)
+    repeated_errors: List[bool] = Field(default_factory=list)
+    time_on_content_s: List[int] = Field(default_factory=list)
+    
+    @model_validator(mode="after")
+    def _check_column_lengths(self) -> "InteractionPatternBatch":
+        lengths = {len(column) for column in self._columns() if column}
+        if len(lengths) > 1:
+            raise ValueError("All non-empty interaction columns must have the same length")
+        return self
+    
+    def _columns(self) -> List[List[Any]]:
+        return [
+            self.response_times_ms,
+            self.action_types,
+            self.clarification_counts,
+            self.repeated_errors,
+            self.time_on_content_s,
+        ]
+    
+    @property
+    def count(self) -> int:
+        """Number of interactions described by the batch."""
+        return max(len(column) for column in self._columns())
+
+
 class BiasDetectionRequest(BaseModel):
     """
     Request for bias detection in content or interactions.
@@ -85,11 +133,38 @@ class BiasDetectionRequest(BaseModel):
     # Interaction context (anonymized)
     interaction_patterns: List[Dict[str, Any]] = Field(
         default_factory=list,
-        description="List of anonymized interaction patterns"
+        description=(
+            "List of anonymized interaction patterns "
+            "(deprecated: prefer interaction_columns)"
+        )
+    )
+    interaction_columns: Optional[InteractionPatternBatch] = Field(
+        None,
+        description="Anonymized interaction patterns in columnar form"
     )
     
     # Optional: Previous adaptations applied
     previous_adaptations: List[str] = Field(default_factory=list)
+    
+    @model_validator(mode="after")
+    def _check_pattern_metrics(self) -> "BiasDetectionRequest":
+        for pattern in self.interaction_patterns:
+            for key in ("response_time_ms", "clarification_count"):
+                value = pattern.get(key, 0)
+                if not isinstance(value, (int, float)):
+                    raise ValueError(f"interaction_patterns {key} must be a number")
+        return self
+
+
+class BiasDetectionBatch(BaseModel):
+    """
+    A batch of bias detection requests processed in a single call.
+    Capped lower than interaction batches since each item carries content.
+    """
+    items: List[BiasDetectionRequest] = Field(
+        ..., min_length=1, max_length=500,
+        description="Bias detection requests to process (max 500 per batch)"
+    )
 
 
 class BiasIndicator(BaseModel):
@@ -144,6 +219,17 @@ class AdaptationRequest(BaseModel):
     )
 
 
+class AdaptationBatch(BaseModel):
+    """
+    A batch of adaptation requests processed in a single call.
+    Capped lower than interaction batches since each item carries content.
+    """
+    items: List[AdaptationRequest] = Field(
+        ..., min_length=1, max_length=500,
+        description="Adaptation requests to process (max 500 per batch)"
+    )
+
+
 class AdaptedContent(BaseModel):
     """A single adapted version of content."""
     adaptation_type: AdaptationType
@@ -166,3 +252,40 @@ class AdaptationResult(BaseModel):
     
     # Audit
     deterministic_hash: str
+
+
+# ============== Content Utilities ==============
+
+class ContentRequest(BaseModel):
+    """Content submitted for readability analysis."""
+    text: str = Field(
+        ..., min_length=1, max_length=100_000, description="Content to analyze"
+    )
+
+
+class SimplifyRequest(BaseModel):
+    """Content submitted for quick simplification."""
+    text: str = Field(
+        ..., min_length=1, max_length=100_000, description="Content to simplify"
+    )
+    level: Literal["simple", "moderate"] = Field(
+        "moderate", description="Simplification level"
+    )
+
+
+class ContentAnalysisResult(BaseModel):
+    """Readability analysis of a piece of content."""
+    readability: Dict[str, float]
+    statistics: Dict[str, Any]
+    complexity_level: str = Field(..., description="simple, moderate, complex")
+    complex_words: List[str] = Field(default_factory=list)
+    reading_time: Dict[str, Any]
+
+
+class SimplificationResult(BaseModel):
+    """Result of a quick text simplification."""
+    original: str
+    simplified: str
+    level: str = Field(..., description="simple or moderate")
+    original_grade: float
+    simplified_grade: float
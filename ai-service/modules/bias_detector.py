@@ -16,9 +16,13 @@ CRITICAL CONSTRAINTS (from PRD.md):
 
 All detection is based on INTERACTION PATTERNS only.
 """
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from functools import lru_cache
 import hashlib
+import re
+import time
+
+import numpy as np
 
 from models.schemas import (
     BiasDetectionRequest,
@@ -32,6 +36,81 @@ from utils.text_analysis import TextAnalyzer
 from config import settings
 
 
+# Example markers matched in one case-insensitive scan, no lowercased copy
+_EXAMPLE_MARKER_RE = re.compile(
+    r'for example|e\.g\.|for instance|such as|example:', re.IGNORECASE
+)
+# Presence checks only, so a single digit is enough to match
+_DIGIT_RE = re.compile(r'\d')
+_LIST_ITEM_RE = re.compile(r'^\s*[-•*]\s+', re.MULTILINE)
+
+
+# One bit per adaptation type, in enum definition order
+_ADAPTATION_ORDER = tuple(AdaptationType)
+_ADAPTATION_BITS = {t: 1 << i for i, t in enumerate(_ADAPTATION_ORDER)}
+
+# Recommended adaptations per bias type, as a bitmask over _ADAPTATION_BITS
+_RECOMMENDATION_MASKS = {
+    BiasType.LANGUAGE_COMPLEXITY: _ADAPTATION_BITS[AdaptationType.SIMPLIFY_LANGUAGE],
+    BiasType.PACE_MISMATCH: _ADAPTATION_BITS[AdaptationType.ADJUST_PACE],
+    BiasType.PRIOR_EXPOSURE_GAP: (
+        _ADAPTATION_BITS[AdaptationType.ADD_EXAMPLES]
+        | _ADAPTATION_BITS[AdaptationType.SIMPLIFY_LANGUAGE]
+    ),
+    BiasType.REPRESENTATION_ISSUE: (
+        _ADAPTATION_BITS[AdaptationType.ADD_EXAMPLES]
+        | _ADAPTATION_BITS[AdaptationType.CHANGE_REPRESENTATION]
+    ),
+}
+
+# Content at least this long is fingerprinted through the LRU cache;
+# shorter strings hash inline so they do not churn the cache
+_FINGERPRINT_CACHE_MIN_LENGTH = 1024
+# Cache keys hold the full content, so oversized content also hashes inline
+_FINGERPRINT_CACHE_MAX_LENGTH = 20_000
+
+
+@lru_cache(maxsize=1024)
+def _cached_content_fingerprint(content: str) -> bytes:
+    """8-byte BLAKE2b digest of content, memoized per distinct text."""
+    return hashlib.blake2b(content.encode(), digest_size=8).digest()
+
+
+def _content_fingerprint(content: str) -> bytes:
+    """8-byte BLAKE2b digest of content for the audit hash."""
+    if _FINGERPRINT_CACHE_MIN_LENGTH <= len(content) <= _FINGERPRINT_CACHE_MAX_LENGTH:
+        return _cached_content_fingerprint(content)
+    return hashlib.blake2b(content.encode(), digest_size=8).digest()
+
+
+# Severity ranking for picking the highest severity in summaries
+_SEVERITY_ORDER = {
+    SeverityLevel.LOW: 0,
+    SeverityLevel.MEDIUM: 1,
+    SeverityLevel.HIGH: 2,
+}
+
+# (epoch second, formatted date/time prefix), swapped as one tuple so
+# concurrent worker threads never pair a prefix with the wrong second
+_ts_cache: Tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time in ISO format with microseconds, without a datetime.
+    
+    The date/time prefix is only re-formatted when the second changes.
+    """
+    global _ts_cache
+    
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_secs, prefix = _ts_cache
+    if secs != cached_secs:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))
+        _ts_cache = (secs, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
+
+
 class BiasDetector:
     """
     Detects bias in academic content and learning interactions.
@@ -68,17 +147,21 @@ class BiasDetector:
         )
         indicators.extend(complexity_indicators)
         
+        # Gather interaction patterns into columns once for steps 2 and 3
+        response_times, clarification_counts, repeated_errors = (
+            self._collect_pattern_columns(request)
+        )
+        has_patterns = clarification_counts.size > 0
+        
         # 2. Analyze interaction patterns for pace mismatch
-        if request.interaction_patterns:
-            pace_indicators = self._detect_pace_mismatch(
-                request.interaction_patterns
-            )
+        if has_patterns:
+            pace_indicators = self._detect_pace_mismatch(response_times)
             indicators.extend(pace_indicators)
         
         # 3. Detect prior exposure gaps (based on interaction patterns)
-        if request.interaction_patterns:
+        if has_patterns:
             exposure_indicators = self._detect_prior_exposure_gaps(
-                request.interaction_patterns
+                clarification_counts, repeated_errors
             )
             indicators.extend(exposure_indicators)
         
@@ -109,10 +192,64 @@ class BiasDetector:
             readability_score=fk_grade,
             complexity_level=complexity_level,
             recommended_actions=recommended_actions,
-            analysis_timestamp=datetime.utcnow().isoformat(),
+            analysis_timestamp=_utc_timestamp(),
             deterministic_hash=audit_hash,
         )
     
+    def detect_bias_batch(
+        self,
+        requests: List[BiasDetectionRequest]
+    ) -> List[BiasDetectionResult]:
+        """
+        Analyze many independent requests in one call.
+        
+        Args:
+            requests: List of BiasDetectionRequest objects
+            
+        Returns:
+            One BiasDetectionResult per request, in input order
+        """
+        detect = self.detect_bias
+        return [detect(request) for request in requests]
+    
+    def _collect_pattern_columns(
+        self,
+        request: BiasDetectionRequest
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gather interaction patterns into columnar arrays.
+        
+        Both the legacy list-of-dicts form and the columnar
+        InteractionPatternBatch are accepted; when both are sent
+        they are concatenated.
+        
+        Returns:
+            (response_times_ms, clarification_counts, repeated_errors).
+            Response times only include interactions that reported one;
+            the other two columns have one entry per interaction.
+            Numeric columns are float64 because legacy patterns may
+            carry fractional or very large values.
+        """
+        patterns = request.interaction_patterns
+        response_times = [
+            p["response_time_ms"] for p in patterns if "response_time_ms" in p
+        ]
+        clarification_counts = [p.get("clarification_count", 0) for p in patterns]
+        repeated_errors = [bool(p.get("is_repeated_error", False)) for p in patterns]
+        
+        columns = request.interaction_columns
+        if columns is not None and columns.count:
+            count = columns.count
+            response_times.extend(columns.response_times_ms)
+            clarification_counts.extend(columns.clarification_counts or [0] * count)
+            repeated_errors.extend(columns.repeated_errors or [False] * count)
+        
+        return (
+            np.asarray(response_times, dtype=np.float64),
+            np.asarray(clarification_counts, dtype=np.float64),
+            np.asarray(repeated_errors, dtype=bool),
+        )
+    
     def _detect_language_complexity_bias(
         self, 
         content: str, 
@@ -183,7 +320,7 @@ class BiasDetector:
     
     def _detect_pace_mismatch(
         self, 
-        interaction_patterns: List[Dict[str, Any]]
+        response_times: np.ndarray
     ) -> List[BiasIndicator]:
         """
         Detect pace mismatch from interaction patterns.
@@ -193,25 +330,13 @@ class BiasDetector:
         """
         indicators = []
         
-        if not interaction_patterns:
-            return indicators
-        
-        # Analyze response times
-        response_times = [
-            p.get("response_time_ms", 0) 
-            for p in interaction_patterns 
-            if "response_time_ms" in p
-        ]
-        
-        if not response_times:
+        if response_times.size == 0:
             return indicators
         
-        avg_response = sum(response_times) / len(response_times)
-        
         # Count slow responses (taking more than threshold)
         slow_threshold_ms = 15000  # 15 seconds
-        slow_responses = sum(1 for t in response_times if t > slow_threshold_ms)
-        slow_ratio = slow_responses / len(response_times)
+        slow_responses = int(np.count_nonzero(response_times > slow_threshold_ms))
+        slow_ratio = slow_responses / response_times.size
         
         if slow_ratio > 0.5:  # More than half responses are slow
             indicators.append(BiasIndicator(
@@ -240,7 +365,8 @@ class BiasDetector:
     
     def _detect_prior_exposure_gaps(
         self, 
-        interaction_patterns: List[Dict[str, Any]]
+        clarification_counts: np.ndarray,
+        repeated_errors: np.ndarray
     ) -> List[BiasIndicator]:
         """
         Detect patterns suggesting prior exposure gaps.
@@ -250,23 +376,18 @@ class BiasDetector:
         """
         indicators = []
         
+        total_interactions = clarification_counts.size
+        if total_interactions == 0:
+            return indicators
+        
         # Count clarification requests
-        clarification_count = sum(
-            p.get("clarification_count", 0) 
-            for p in interaction_patterns
-        )
+        clarification_count = float(clarification_counts.sum())
         
         # Count repeated errors (same concept multiple times)
-        repeated_errors = sum(
-            1 for p in interaction_patterns if p.get("is_repeated_error", False)
-        )
-        
-        total_interactions = len(interaction_patterns)
-        if total_interactions == 0:
-            return indicators
+        repeated_error_count = int(np.count_nonzero(repeated_errors))
         
         clarification_ratio = clarification_count / total_interactions
-        error_ratio = repeated_errors / total_interactions
+        error_ratio = repeated_error_count / total_interactions
         
         # High clarification rate suggests assumed prior knowledge
         if clarification_ratio > 1.5:  # More than 1.5 clarifications per interaction
@@ -310,11 +431,13 @@ class BiasDetector:
         """
         indicators = []
         
-        # Check for lack of examples
-        example_markers = ["for example", "e.g.", "for instance", "such as", "example:"]
-        has_examples = any(marker in content.lower() for marker in example_markers)
+        # Both checks need at least 300 characters; short content scans nothing
+        length = len(content)
+        if length <= 300:
+            return indicators
         
-        if len(content) > 500 and not has_examples:
+        # Check for lack of examples (only scanned when long enough to matter)
+        if length > 500 and _EXAMPLE_MARKER_RE.search(content) is None:
             indicators.append(BiasIndicator(
                 bias_type=BiasType.REPRESENTATION_ISSUE,
                 severity=SeverityLevel.LOW,
@@ -326,12 +449,12 @@ class BiasDetector:
                 affected_content_segment=None
             ))
         
-        # Check for purely abstract content (no numbers, no concrete terms)
-        import re
-        has_numbers = bool(re.search(r'\d+', content))
-        has_lists = bool(re.search(r'^\s*[-•*]\s+', content, re.MULTILINE))
-        
-        if len(content) > 300 and not has_numbers and not has_lists:
+        # Check for purely abstract content (no numbers, no concrete terms);
+        # the list scan only runs when no digit was found
+        if (
+            _DIGIT_RE.search(content) is None
+            and _LIST_ITEM_RE.search(content) is None
+        ):
             indicators.append(BiasIndicator(
                 bias_type=BiasType.REPRESENTATION_ISSUE,
                 severity=SeverityLevel.LOW,
@@ -350,21 +473,17 @@ class BiasDetector:
         indicators: List[BiasIndicator]
     ) -> List[AdaptationType]:
         """Build recommended actions based on detected bias."""
-        recommendations = set()
+        # OR together per-type bitmasks, then decode in enum order
+        mask = 0
         
         for indicator in indicators:
-            if indicator.bias_type == BiasType.LANGUAGE_COMPLEXITY:
-                recommendations.add(AdaptationType.SIMPLIFY_LANGUAGE)
-            elif indicator.bias_type == BiasType.PACE_MISMATCH:
-                recommendations.add(AdaptationType.ADJUST_PACE)
-            elif indicator.bias_type == BiasType.PRIOR_EXPOSURE_GAP:
-                recommendations.add(AdaptationType.ADD_EXAMPLES)
-                recommendations.add(AdaptationType.SIMPLIFY_LANGUAGE)
-            elif indicator.bias_type == BiasType.REPRESENTATION_ISSUE:
-                recommendations.add(AdaptationType.ADD_EXAMPLES)
-                recommendations.add(AdaptationType.CHANGE_REPRESENTATION)
-        
-        return list(recommendations)
+            mask |= _RECOMMENDATION_MASKS.get(indicator.bias_type, 0)
+        
+        return [
+            adaptation_type
+            for adaptation_type in _ADAPTATION_ORDER
+            if mask & _ADAPTATION_BITS[adaptation_type]
+        ]
     
     def _generate_audit_hash(
         self, 
@@ -373,14 +492,17 @@ class BiasDetector:
         indicators: List[BiasIndicator]
     ) -> str:
         """Generate deterministic hash for audit trail."""
-        data = {
-            "session": session_hash,
-            "content_hash": hashlib.sha256(content.encode()).hexdigest()[:16],
-            "indicator_count": len(indicators),
-            "indicator_types": sorted([i.bias_type.value for i in indicators])
-        }
-        data_str = str(sorted(data.items()))
-        return hashlib.sha256(data_str.encode()).hexdigest()[:16]
+        # Canonical byte stream: NUL-terminated session, 8-byte content digest,
+        # indicator count, then the sorted indicator types NUL-terminated
+        h = hashlib.blake2b(digest_size=8)
+        h.update(session_hash.encode())
+        h.update(b'\x00')
+        h.update(_content_fingerprint(content))
+        h.update(len(indicators).to_bytes(4, 'little'))
+        for bias_type in sorted(i.bias_type.value for i in indicators):
+            h.update(bias_type.encode())
+            h.update(b'\x00')
+        return h.hexdigest()
     
     def get_bias_summary(
         self, 
@@ -412,7 +534,7 @@ class BiasDetector:
             "severity_distribution": severity_counts,
             "type_distribution": type_counts,
             "highest_severity": max(
-                [i.severity for i in indicators], 
-                key=lambda s: ["low", "medium", "high"].index(s.value)
+                (i.severity for i in indicators),
+                key=_SEVERITY_ORDER.__getitem__
             ).value
         }
@@ -15,8 +15,11 @@ PRIVACY GUARANTEE:
 """
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from operator import attrgetter
 import hashlib
-import statistics
+import json
+
+import numpy as np
 
 from models.schemas import (
     InteractionData,
@@ -25,6 +28,12 @@ from models.schemas import (
 )
 
 
+# Field accessors for sequence aggregation
+_GET_RESPONSE_TIME = attrgetter("response_time_ms")
+_GET_CLARIFICATIONS = attrgetter("clarification_count")
+_GET_REPEATED_ERROR = attrgetter("is_repeated_error")
+
+
 class InteractionAnalyzer:
     """
     Analyzes interaction patterns to detect potential learning barriers.
@@ -85,6 +94,22 @@ class InteractionAnalyzer:
             suggested_adaptations=suggested_adaptations,
         )
     
+    def analyze_batch(
+        self,
+        interactions: List[InteractionData]
+    ) -> List[InteractionAnalysisResult]:
+        """
+        Analyze many independent interactions in one call.
+        
+        Args:
+            interactions: List of anonymized interactions
+            
+        Returns:
+            One analysis result per interaction, in input order
+        """
+        analyze = self.analyze_single_interaction
+        return [analyze(interaction) for interaction in interactions]
+    
     def analyze_interaction_sequence(
         self,
         interactions: List[InteractionData]
@@ -106,13 +131,18 @@ class InteractionAnalyzer:
             }
         
         # Calculate response time statistics
-        response_times = [i.response_time_ms for i in interactions]
-        avg_response = statistics.mean(response_times)
+        response_times = np.fromiter(
+            map(_GET_RESPONSE_TIME, interactions),
+            dtype=np.int64,
+            count=len(interactions),
+        )
+        avg_response = float(response_times.mean())
         response_trend = self._calculate_trend(response_times)
         
-        # Count clarifications
-        total_clarifications = sum(i.clarification_count for i in interactions)
-        repeated_errors = sum(1 for i in interactions if i.is_repeated_error)
+        # Count clarifications (attribute loads run in C via attrgetter;
+        # repeated-error flags sum as 0/1)
+        total_clarifications = sum(map(_GET_CLARIFICATIONS, interactions))
+        repeated_errors = sum(map(_GET_REPEATED_ERROR, interactions))
         
         # Determine overall pattern
         if avg_response > self.slow_response_threshold:
@@ -229,15 +259,15 @@ class InteractionAnalyzer:
         
         return requires_adaptation, adaptations
     
-    def _calculate_trend(self, values: List[int]) -> str:
+    def _calculate_trend(self, values: np.ndarray) -> str:
         """Calculate trend in a series of values."""
-        if len(values) < 3:
+        if values.size < 3:
             return "insufficient_data"
         
         # Simple trend: compare first half to second half
-        midpoint = len(values) // 2
-        first_half_avg = statistics.mean(values[:midpoint])
-        second_half_avg = statistics.mean(values[midpoint:])
+        midpoint = values.size // 2
+        first_half_avg = float(values[:midpoint].mean())
+        second_half_avg = float(values[midpoint:].mean())
         
         threshold = 0.1  # 10% change threshold
         
@@ -251,6 +281,7 @@ class InteractionAnalyzer:
     @staticmethod
     def generate_deterministic_hash(data: Dict[str, Any]) -> str:
         """Generate deterministic hash for audit trail."""
-        # Sort keys for deterministic ordering
-        sorted_str = str(sorted(data.items()))
-        return hashlib.sha256(sorted_str.encode()).hexdigest()[:16]
+        # Sort keys for deterministic ordering; compact C-level JSON encoding
+        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+        # 8-byte digest emitted directly rather than truncating SHA-256
+        return hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()
@@ -3,12 +3,8 @@ Pytest Fixtures for ANANYA-AI Service
 """
 import pytest
 from fastapi.testclient import TestClient
-import sys
-import os
-
-# Add parent directory to path to import modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# The service root is put on sys.path by pytest.ini (pythonpath = .)
 from main import app
 from models.schemas import (
     InteractionData, 
@@ -19,10 +15,15 @@ from models.schemas import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """FastAPI Test Client"""
-    return TestClient(app)
+    """
+    FastAPI Test Client (runs the app lifespan so AI modules are initialized)
+    
+    Module-scoped so the lifespan runs once per test module, not per test.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -33,7 +34,6 @@ def sample_interaction():
         content_id="content_abc",
         response_time_ms=5000,
         action_type="read",
-        content_text="Sample learning content",
         is_repeated_error=False,
         clarification_count=0,
         time_on_content_seconds=30
@@ -48,16 +48,20 @@ def slow_interaction():
         content_id="content_abc",
         response_time_ms=25000,  # Very slow
         action_type="read",
-        content_text="Complex content",
         is_repeated_error=True,
         clarification_count=0,
         time_on_content_seconds=120
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_text():
-    """Text with high complexity"""
+    """
+    Text with high complexity
+    
+    Its readability metrics are memoized by TextAnalyzer after the first
+    test that analyzes it, so later tests reuse them.
+    """
     return (
         "The implementations of sophisticated algorithmic paradigms necessitate "
         "comprehensive understanding of computational complexity theory and "
@@ -65,7 +69,7 @@ def complex_text():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_text():
     """Text with low complexity"""
     return "The cat sat on the mat. It was a happy cat."
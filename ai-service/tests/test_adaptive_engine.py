@@ -12,8 +12,10 @@ from models.schemas import AdaptationRequest, AdaptationType
 
 class TestAdaptiveEngine:
     
-    def setup_method(self):
-        self.engine = AdaptiveEngine()
+    @classmethod
+    def setup_class(cls):
+        # Stateless, so one instance serves every test in the class
+        cls.engine = AdaptiveEngine()
     
     def test_simplify_language(self, complex_text):
         """Test language simplification."""
@@ -83,3 +85,72 @@ class TestAdaptiveEngine:
         
         assert len(result.adaptations) == 2
         assert result.primary_recommendation is not None
+
+    def test_audit_hash_consistency(self, simple_text):
+        """Test that the audit hash is deterministic and ignores request order."""
+        def make_request(adaptations):
+            return AdaptationRequest(
+                session_hash="test_123",
+                original_content=simple_text,
+                requested_adaptations=adaptations,
+                interaction_signals={}
+            )
+        
+        forward = self.engine.generate_adaptation(make_request([
+            AdaptationType.SIMPLIFY_LANGUAGE,
+            AdaptationType.ADJUST_PACE,
+        ]))
+        reverse = self.engine.generate_adaptation(make_request([
+            AdaptationType.ADJUST_PACE,
+            AdaptationType.SIMPLIFY_LANGUAGE,
+        ]))
+        
+        assert forward.deterministic_hash == reverse.deterministic_hash
+        assert len(forward.deterministic_hash) == 16
+
+    def test_extract_key_concepts_bounded(self):
+        """Test key concepts are unique, first-seen ordered and capped at five."""
+        content = (
+            "Alpha meets Beta. Alpha returns. Gamma, Delta and Epsilon "
+            "arrive before Zeta and \"quoted term\"."
+        )
+        
+        concepts = self.engine._extract_key_concepts(content)
+        
+        assert concepts == ["Alpha", "Beta", "Gamma", "Delta", "Epsilon"]
+
+    def test_multiple_variants_match_direct_simplification(self, complex_text):
+        """Test derived variants equal running each simplification level directly."""
+        variants = self.engine.generate_multiple_variants(complex_text)
+        
+        assert [v.complexity_level for v in variants] == ["original", "moderate", "simple"]
+        analyzer = self.engine.text_analyzer
+        assert variants[1].content == analyzer.simplify_text(complex_text, "moderate")
+        assert variants[2].content == analyzer.simplify_text(complex_text, "simple")
+
+    def test_single_variant_skips_simplification(self, complex_text, monkeypatch):
+        """Test that requesting only the original does no simplification work."""
+        def fail(*args, **kwargs):
+            raise AssertionError("simplify_text should not be called")
+        monkeypatch.setattr(self.engine.text_analyzer, "simplify_text", fail)
+        
+        variants = self.engine.generate_multiple_variants(complex_text, num_variants=1)
+        
+        assert len(variants) == 1
+        assert variants[0].content == complex_text
+
+    def test_short_content_fast_path(self):
+        """Test that stub content is returned without running adaptations."""
+        req = AdaptationRequest(
+            session_hash="test_123",
+            original_content="  What is this?  ",
+            requested_adaptations=[AdaptationType.SIMPLIFY_LANGUAGE],
+            interaction_signals={}
+        )
+        
+        result = self.engine.generate_adaptation(req)
+        
+        assert result.adaptations == []
+        assert result.primary_recommendation is None
+        assert result.adaptation_reasoning == "Content too short to adapt"
+        assert len(result.deterministic_hash) == 16
@@ -7,14 +7,25 @@ Verifies:
 - Privacy constraints (no user IDs)
 """
 import pytest
+from datetime import datetime, timezone
 from modules.bias_detector import BiasDetector
-from models.schemas import BiasType, SeverityLevel, BiasDetectionRequest
+from pydantic import ValidationError
+from models.schemas import (
+    AdaptationType,
+    BiasIndicator,
+    BiasType,
+    SeverityLevel,
+    BiasDetectionRequest,
+    InteractionPatternBatch,
+)
 
 
 class TestBiasDetector:
     
-    def setup_method(self):
-        self.detector = BiasDetector()
+    @classmethod
+    def setup_class(cls):
+        # Stateless, so one instance serves every test in the class
+        cls.detector = BiasDetector()
     
     def test_detect_high_complexity(self, complex_text):
         """Test detection of overly complex language."""
@@ -95,6 +106,62 @@ class TestBiasDetector:
         )
         assert exposure_bias is not None
 
+    def test_columnar_patterns_match_dict_patterns(self):
+        """Test columnar interaction patterns give the same indicators as dicts."""
+        dict_req = BiasDetectionRequest(
+            session_hash="test_123",
+            content_text="Normal content",
+            interaction_patterns=[
+                {"response_time_ms": 20000, "clarification_count": 2},
+                {"response_time_ms": 18000, "clarification_count": 3},
+                {"response_time_ms": 5000, "clarification_count": 1},
+            ]
+        )
+        columnar_req = BiasDetectionRequest(
+            session_hash="test_123",
+            content_text="Normal content",
+            interaction_columns=InteractionPatternBatch(
+                response_times_ms=[20000, 18000, 5000],
+                clarification_counts=[2, 3, 1],
+            )
+        )
+        
+        dict_result = self.detector.detect_bias(dict_req)
+        columnar_result = self.detector.detect_bias(columnar_req)
+        
+        assert columnar_result.indicators == dict_result.indicators
+        assert any(i.bias_type == BiasType.PACE_MISMATCH for i in columnar_result.indicators)
+        assert any(i.bias_type == BiasType.PRIOR_EXPOSURE_GAP for i in columnar_result.indicators)
+    
+    def test_columnar_patterns_reject_ragged_columns(self):
+        """Test that columns of different lengths are rejected."""
+        with pytest.raises(ValidationError):
+            InteractionPatternBatch(
+                response_times_ms=[20000, 18000],
+                clarification_counts=[1],
+            )
+
+    def test_dict_patterns_keep_fractional_and_large_values(self):
+        """Test legacy pattern values are compared as given, not truncated."""
+        def detect(patterns):
+            result = self.detector.detect_bias(BiasDetectionRequest(
+                session_hash="test_123",
+                content_text="Normal content",
+                interaction_patterns=patterns
+            ))
+            return {i.bias_type for i in result.indicators}
+        
+        assert BiasType.PACE_MISMATCH in detect([{"response_time_ms": 15000.5}] * 2)
+        assert BiasType.PRIOR_EXPOSURE_GAP in detect([{"clarification_count": 1.6}] * 2)
+        assert BiasType.PACE_MISMATCH in detect([{"response_time_ms": 2 ** 70}])
+        
+        with pytest.raises(ValidationError):
+            BiasDetectionRequest(
+                session_hash="test_123",
+                content_text="Normal content",
+                interaction_patterns=[{"response_time_ms": "20000"}]
+            )
+
     def test_audit_hash_consistency(self, simple_text):
         """Test that same input produces same audit hash (deterministic)."""
         req = BiasDetectionRequest(
@@ -107,3 +174,72 @@ class TestBiasDetector:
         result2 = self.detector.detect_bias(req)
         
         assert result1.deterministic_hash == result2.deterministic_hash
+
+    def test_analysis_timestamp_is_iso_utc(self, simple_text):
+        """Test the analysis timestamp parses as a current naive UTC ISO time."""
+        req = BiasDetectionRequest(
+            session_hash="test_123",
+            content_text=simple_text,
+            interaction_patterns=[]
+        )
+        
+        before = datetime.now(timezone.utc).replace(tzinfo=None)
+        result = self.detector.detect_bias(req)
+        stamp = datetime.fromisoformat(result.analysis_timestamp)
+        
+        assert stamp.tzinfo is None
+        assert abs((stamp - before).total_seconds()) < 5
+
+    def test_bias_summary_highest_severity(self):
+        """Test the summary reports the highest severity and counts."""
+        def make(severity):
+            return BiasIndicator(
+                bias_type=BiasType.LANGUAGE_COMPLEXITY,
+                severity=severity,
+                confidence=0.5,
+                description="test indicator",
+            )
+        
+        summary = self.detector.get_bias_summary([
+            make(SeverityLevel.LOW),
+            make(SeverityLevel.HIGH),
+            make(SeverityLevel.MEDIUM),
+        ])
+        
+        assert summary["highest_severity"] == "high"
+        assert summary["severity_distribution"] == {"low": 1, "high": 1, "medium": 1}
+        assert self.detector.get_bias_summary([])["bias_detected"] is False
+
+    def test_recommendations_deduped_in_enum_order(self):
+        """Test recommendations are unique and listed in AdaptationType order."""
+        indicators = [
+            BiasIndicator(
+                bias_type=bias_type,
+                severity=SeverityLevel.LOW,
+                confidence=0.5,
+                description="test indicator",
+            )
+            for bias_type in (
+                BiasType.REPRESENTATION_ISSUE,
+                BiasType.PRIOR_EXPOSURE_GAP,
+                BiasType.LANGUAGE_COMPLEXITY,
+            )
+        ]
+        
+        recommendations = self.detector._build_recommendations(indicators)
+        
+        assert recommendations == [
+            AdaptationType.SIMPLIFY_LANGUAGE,
+            AdaptationType.ADD_EXAMPLES,
+            AdaptationType.CHANGE_REPRESENTATION,
+        ]
+
+    def test_representation_checks_length_gated(self):
+        """Test representation issues only apply to sufficiently long content."""
+        abstract = "Abstract ideas connect to other abstract ideas. "
+        
+        assert self.detector._detect_representation_issues(abstract * 6) == []
+        
+        long_issues = self.detector._detect_representation_issues(abstract * 12)
+        assert len(long_issues) == 2
+        assert all(i.bias_type == BiasType.REPRESENTATION_ISSUE for i in long_issues)
@@ -12,8 +12,10 @@ from models.schemas import InteractionData
 
 class TestInteractionAnalyzer:
     
-    def setup_method(self):
-        self.analyzer = InteractionAnalyzer()
+    @classmethod
+    def setup_class(cls):
+        # Stateless, so one instance serves every test in the class
+        cls.analyzer = InteractionAnalyzer()
     
     def test_analyze_slow_response(self, slow_interaction):
         """Test analysis of struggle patterns (slow response)."""
@@ -30,7 +32,6 @@ class TestInteractionAnalyzer:
             content_id="abc",
             response_time_ms=500,  # Quick
             action_type="read",
-            content_text="Simple",
             is_repeated_error=False,
             clarification_count=0,
             time_on_content_seconds=5
@@ -48,7 +49,6 @@ class TestInteractionAnalyzer:
             content_id="abc",
             response_time_ms=5000,
             action_type="clarification",
-            content_text="Confusing",
             is_repeated_error=False,
             clarification_count=1,
             time_on_content_seconds=20
@@ -59,3 +59,44 @@ class TestInteractionAnalyzer:
         assert result.response_pattern == "seeking_help"
         assert result.engagement_level == "high"  # Help seeking = engagement
         assert result.comprehension_indicators["help_seeking"] is True
+
+    def test_analyze_batch(self, sample_interaction, slow_interaction):
+        """Test batch analysis matches per-interaction analysis, in order."""
+        results = self.analyzer.analyze_batch([sample_interaction, slow_interaction])
+        
+        assert len(results) == 2
+        assert results[0] == self.analyzer.analyze_single_interaction(sample_interaction)
+        assert results[1].response_pattern == "deliberate"
+        assert results[1].requires_adaptation is True
+
+    def test_deterministic_hash_ignores_key_order(self):
+        """Test the audit hash depends on content, not dict insertion order."""
+        first = InteractionAnalyzer.generate_deterministic_hash({"a": 1, "b": [1, 2]})
+        second = InteractionAnalyzer.generate_deterministic_hash({"b": [1, 2], "a": 1})
+        other = InteractionAnalyzer.generate_deterministic_hash({"a": 2, "b": [1, 2]})
+        
+        assert first == second
+        assert first != other
+        assert len(first) == 16
+
+    def test_analyze_interaction_sequence(self):
+        """Test sequence aggregation over response times and clarifications."""
+        def make(response_time_ms, clarifications=0):
+            return InteractionData(
+                session_hash="test_session",
+                content_id="c1",
+                response_time_ms=response_time_ms,
+                action_type="answer",
+                clarification_count=clarifications,
+            )
+        
+        improving = [make(9000), make(8000), make(3000), make(2000)]
+        result = self.analyzer.analyze_interaction_sequence(improving)
+        
+        assert result["pattern_summary"] == "progressing"
+        assert result["trend"] == "improving"
+        assert result["metrics"]["avg_response_time_ms"] == 5500
+        assert result["metrics"]["interaction_count"] == 4
+        
+        empty = self.analyzer.analyze_interaction_sequence([])
+        assert empty["pattern_summary"] == "insufficient_data"
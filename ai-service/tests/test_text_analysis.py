@@ -0,0 +1,69 @@
+"""
+Unit Tests for Text Analysis Utilities
+Verifies:
+- Memoized results are stable across calls
+- Callers cannot corrupt cached results
+"""
+import pytest
+from utils import text_analysis
+from utils.text_analysis import TextAnalyzer
+
+
+class TestTextAnalyzer:
+    
+    def test_complex_words_cached_copies(self, complex_text):
+        """Test repeated complex-word lookups return equal, independent lists."""
+        first = TextAnalyzer.identify_complex_words(complex_text)
+        first.append("mutated")
+        second = TextAnalyzer.identify_complex_words(complex_text)
+        
+        assert "mutated" not in second
+        assert second == sorted(second)
+        assert "sophisticated" in second
+
+    def test_jargon_patterns_cached_copies(self):
+        """Test repeated jargon lookups are not affected by caller mutation."""
+        text = "Therefore the methodology is sound, hence the framework holds."
+        
+        first = TextAnalyzer.identify_jargon_patterns(text)
+        first[0]["matches"].append("mutated")
+        first[0]["type"] = "mutated"
+        second = TextAnalyzer.identify_jargon_patterns(text)
+        
+        assert second[0]["type"] == "academic_language"
+        assert second[0]["matches"] == ["therefore", "hence"]
+
+    def test_simplify_text_replaces_phrases_and_words(self):
+        """Test phrase and word replacements match any case and keep capitals."""
+        text = "In Order To UTILIZE the methodology, Prior to testing we evaluate."
+        
+        simplified = TextAnalyzer.simplify_text(text)
+        
+        assert simplified == "To Use the method, Before testing we check."
+
+    def test_reading_time_reuses_readability_metrics(self, complex_text):
+        """Test passing precomputed metrics gives the same reading-time estimate."""
+        metrics = TextAnalyzer.get_readability_metrics(complex_text)
+        
+        reused = TextAnalyzer.generate_reading_time_estimate(complex_text, metrics=metrics)
+        
+        assert reused == TextAnalyzer.generate_reading_time_estimate(complex_text)
+        assert reused["complexity_adjusted_minutes"] > reused["estimated_minutes"]
+
+    def test_simplify_text_handles_case_folded_matches(self):
+        """Test matches whose lowercase differs from the key still get replaced."""
+        assert TextAnalyzer.simplify_text("We ſelect data") == "We choose data"
+        assert TextAnalyzer.simplify_text("İdentify it") == "Find it"
+
+    def test_oversized_text_bypasses_caches(self):
+        """Test texts above the cache limit are analyzed but never cached."""
+        text = "Therefore the methodology holds. " * 1000
+        assert len(text) > text_analysis._CACHE_MAX_TEXT_LENGTH
+        before = text_analysis._cached_readability_metrics.cache_info().currsize
+        
+        metrics = TextAnalyzer.get_readability_metrics(text)
+        patterns = TextAnalyzer.identify_jargon_patterns(text)
+        
+        assert metrics["flesch_kincaid_grade"] > 0
+        assert [p["matches"] for p in patterns] == [["therefore"], ["methodology"]]
+        assert text_analysis._cached_readability_metrics.cache_info().currsize == before
@@ -6,7 +6,154 @@ Uses textstat for readability metrics - no external API calls needed.
 """
 import textstat
 import re
-from typing import Dict, Any, List, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# The per-text caches below bound entry counts, not bytes: texts longer
+# than this are analyzed uncached so large distinct bodies cannot pin memory
+_CACHE_MAX_TEXT_LENGTH = 20_000
+# Longest word whose syllable count is kept in the word cache
+_CACHE_MAX_WORD_LENGTH = 64
+
+
+def _memoized(cached: Callable[..., Any], text: str, *args: Any) -> Any:
+    """Call an lru_cache'd helper, bypassing the cache for oversized text."""
+    if len(text) > _CACHE_MAX_TEXT_LENGTH:
+        return cached.__wrapped__(text, *args)
+    return cached(text, *args)
+
+
+@lru_cache(maxsize=1024)
+def _cached_readability_metrics(text: str) -> Tuple[Tuple[str, float], ...]:
+    """
+    Compute readability metrics once per distinct text.
+    
+    Returns an immutable tuple of (name, score) pairs so cached entries
+    cannot be mutated by callers.
+    """
+    return (
+        ("flesch_kincaid_grade", textstat.flesch_kincaid_grade(text)),
+        ("flesch_reading_ease", textstat.flesch_reading_ease(text)),
+        ("gunning_fog", textstat.gunning_fog(text)),
+        ("smog_index", textstat.smog_index(text)),
+        ("automated_readability_index", textstat.automated_readability_index(text)),
+        ("coleman_liau_index", textstat.coleman_liau_index(text)),
+        ("dale_chall_readability", textstat.dale_chall_readability_score(text)),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _cached_grade_level(text: str) -> float:
+    """Compute only the Flesch-Kincaid grade once per distinct text."""
+    return textstat.flesch_kincaid_grade(text)
+
+
+@lru_cache(maxsize=1024)
+def _cached_word_count(text: str) -> int:
+    """Count words once for both text statistics and reading time."""
+    return textstat.lexicon_count(text, removepunct=True)
+
+
+@lru_cache(maxsize=1024)
+def _cached_text_statistics(text: str) -> Tuple[Tuple[str, Any], ...]:
+    """Compute basic text statistics once per distinct text."""
+    word_count = _memoized(_cached_word_count, text)
+    sentence_count = textstat.sentence_count(text)
+    
+    return (
+        ("word_count", word_count),
+        ("sentence_count", sentence_count),
+        ("syllable_count", textstat.syllable_count(text)),
+        ("char_count", len(text)),
+        ("avg_words_per_sentence", round(word_count / max(sentence_count, 1), 2)),
+    )
+
+
+@lru_cache(maxsize=64)
+def _cached_lower(text: str) -> str:
+    """
+    Lowercase a text once for all analyzers that case-fold it.
+    
+    Kept small: callers analyzing one request hit it back-to-back.
+    """
+    return text.lower()
+
+
+@lru_cache(maxsize=65536)
+def _cached_syllable_count(word: str) -> int:
+    """
+    Count syllables in a single word once per process.
+    
+    textstat's own cache is too small to hold a long text's vocabulary,
+    so common words would otherwise be re-counted on every new text.
+    """
+    return textstat.syllable_count(word)
+
+
+def _syllable_count(word: str) -> int:
+    """Syllables in a word, cached unless the word is implausibly long."""
+    if len(word) > _CACHE_MAX_WORD_LENGTH:
+        return textstat.syllable_count(word)
+    return _cached_syllable_count(word)
+
+
+@lru_cache(maxsize=1024)
+def _cached_complex_words(text: str, syllable_threshold: int) -> Tuple[str, ...]:
+    """Find sorted unique complex words once per distinct text and threshold."""
+    unique_words = set(TextAnalyzer._WORD_RE.findall(_memoized(_cached_lower, text)))
+    
+    return tuple(sorted(
+        word for word in unique_words
+        if _syllable_count(word) >= syllable_threshold
+    ))
+
+
+@lru_cache(maxsize=1024)
+def _cached_jargon_patterns(text: str) -> Tuple[Dict[str, Any], ...]:
+    """
+    Find jargon indicators once per distinct text.
+    
+    Match lists are stored as tuples; identify_jargon_patterns hands
+    out fresh copies so cached entries are never mutated.
+    """
+    patterns = []
+    text_lower = _memoized(_cached_lower, text)
+    
+    group_of = TextAnalyzer._ACADEMIC_MARKER_GROUP_OF
+    grouped: Dict[int, Dict[str, None]] = {}
+    for match in TextAnalyzer._ACADEMIC_MARKER_RE.findall(text_lower):
+        grouped.setdefault(group_of[match], {})[match] = None  # first-seen order
+    
+    for index in sorted(grouped):
+        patterns.append({
+            "type": "academic_language",
+            "matches": tuple(grouped[index]),
+            "suggestion": "Consider simpler alternatives"
+        })
+    
+    # Long sentence detection
+    sentences = TextAnalyzer._SENTENCE_SPLIT_RE.split(text)
+    long_sentences = [s.strip() for s in sentences if len(s.split()) > 30]
+    if long_sentences:
+        patterns.append({
+            "type": "long_sentences",
+            "count": len(long_sentences),
+            "suggestion": "Break into shorter sentences"
+        })
+    
+    return tuple(patterns)
+
+
+def _replace_match(match: "re.Match[str]") -> str:
+    """Swap in the simple replacement, capitalized if the original was."""
+    original = match.group(0)
+    # By group index: IGNORECASE also matches forms like 'ſ' or 'İ'
+    # whose lower() differs from the key
+    simple_word = TextAnalyzer._REPLACEMENT_VALUES[match.lastindex]
+    if original[0].isupper():
+        return simple_word[0].upper() + simple_word[1:]
+    return simple_word
 
 
 class TextAnalyzer:
@@ -15,11 +162,93 @@ class TextAnalyzer:
     Used by bias detection to identify language complexity issues.
     """
     
+    # Patterns compiled once at class load, not per call
+    _WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+    _SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+    _SENTENCE_KEEP_RE = re.compile(r'([.!?]+)')
+    
+    # Academic/technical patterns, one group per reported indicator
+    _ACADEMIC_MARKER_GROUPS = (
+        ('therefore', 'hence', 'thus', 'wherein', 'whereby', 'herein'),
+        ('aforementioned', 'notwithstanding', 'pursuant'),
+        ('paradigm', 'methodology', 'framework', 'implementation'),
+        ('utilizing', 'commenced', 'terminated', 'facilitated'),
+    )
+    _ACADEMIC_MARKER_GROUP_OF = {
+        word: index
+        for index, group in enumerate(_ACADEMIC_MARKER_GROUPS)
+        for word in group
+    }
+    # Scanned once; matches are bucketed back into their groups
+    _ACADEMIC_MARKER_RE = re.compile(
+        r'\b(' + '|'.join(_ACADEMIC_MARKER_GROUP_OF) + r')\b'
+    )
+    
+    # Common academic → simple word replacements
+    _REPLACEMENTS = {
+        "utilize": "use",
+        "implement": "do",
+        "facilitate": "help",
+        "commence": "start",
+        "terminate": "end",
+        "prior to": "before",
+        "subsequent to": "after",
+        "in order to": "to",
+        "due to the fact that": "because",
+        "at this point in time": "now",
+        "in the event that": "if",
+        "for the purpose of": "to",
+        "in addition to": "also",
+        "with regard to": "about",
+        "in accordance with": "following",
+        "nevertheless": "but",
+        "furthermore": "also",
+        "consequently": "so",
+        "approximately": "about",
+        "sufficient": "enough",
+        "demonstrate": "show",
+        "indicate": "show",
+        "obtain": "get",
+        "require": "need",
+        "assist": "help",
+        "attempt": "try",
+        "determine": "find out",
+        "establish": "set up",
+        "evaluate": "check",
+        "identify": "find",
+        "maintain": "keep",
+        "modify": "change",
+        "perform": "do",
+        "provide": "give",
+        "regarding": "about",
+        "remain": "stay",
+        "request": "ask for",
+        "select": "choose",
+        "therefore": "so",
+        "currently": "now",
+        "additional": "more",
+        "component": "part",
+        "methodology": "method",
+        "functionality": "feature",
+    }
+    # One alternation so simplify_text rewrites in a single pass;
+    # longest phrases first so a phrase wins over any word inside it
+    _REPLACEMENT_KEYS = tuple(sorted(_REPLACEMENTS, key=len, reverse=True))
+    _REPLACEMENT_RE = re.compile(
+        '|'.join('(' + re.escape(k) + ')' for k in _REPLACEMENT_KEYS),
+        re.IGNORECASE,
+    )
+    # Indexed by match.lastindex; group numbers start at 1
+    _REPLACEMENT_VALUES = (None,) + tuple(map(_REPLACEMENTS.get, _REPLACEMENT_KEYS))
+    
     @staticmethod
     def get_readability_metrics(text: str) -> Dict[str, float]:
         """
         Calculate comprehensive readability metrics.
         
+        Results are memoized per text, so repeated lesson content
+        skips the textstat pipeline.
+        
         Returns:
             Dict with multiple readability scores
         """
@@ -34,15 +263,23 @@ class TextAnalyzer:
                 "dale_chall_readability": 0.0,
             }
         
-        return {
-            "flesch_kincaid_grade": textstat.flesch_kincaid_grade(text),
-            "flesch_reading_ease": textstat.flesch_reading_ease(text),
-            "gunning_fog": textstat.gunning_fog(text),
-            "smog_index": textstat.smog_index(text),
-            "automated_readability_index": textstat.automated_readability_index(text),
-            "coleman_liau_index": textstat.coleman_liau_index(text),
-            "dale_chall_readability": textstat.dale_chall_readability_score(text),
-        }
+        return dict(_memoized(_cached_readability_metrics, text))
+    
+    @staticmethod
+    def get_grade_level(text: str) -> float:
+        """
+        Calculate only the Flesch-Kincaid grade level.
+        
+        Cheaper than get_readability_metrics when the other scores
+        are not needed; matches its flesch_kincaid_grade value.
+        
+        Returns:
+            Grade level score
+        """
+        if not text or len(text.strip()) < 10:
+            return 0.0
+        
+        return _memoized(_cached_grade_level, text)
     
     @staticmethod
     def get_complexity_level(flesch_kincaid_grade: float) -> str:
@@ -67,25 +304,21 @@ class TextAnalyzer:
         """
         Get basic text statistics.
         
+        Results are memoized per text.
+        
         Returns:
             Dict with word count, sentence count, etc.
         """
-        return {
-            "word_count": textstat.lexicon_count(text, removepunct=True),
-            "sentence_count": textstat.sentence_count(text),
-            "syllable_count": textstat.syllable_count(text),
-            "char_count": len(text),
-            "avg_words_per_sentence": round(
-                textstat.lexicon_count(text, removepunct=True) / 
-                max(textstat.sentence_count(text), 1), 2
-            ),
-        }
+        return dict(_memoized(_cached_text_statistics, text))
     
     @staticmethod
     def identify_complex_words(text: str, syllable_threshold: int = 3) -> List[str]:
         """
         Identify words that may be difficult to understand.
         
+        Results are memoized per text and threshold; each call
+        returns a new list.
+        
         Args:
             text: Text to analyze
             syllable_threshold: Minimum syllables to consider complex
@@ -93,14 +326,7 @@ class TextAnalyzer:
         Returns:
             List of complex words found
         """
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-        complex_words = []
-        
-        for word in set(words):  # Unique words only
-            if textstat.syllable_count(word) >= syllable_threshold:
-                complex_words.append(word)
-        
-        return sorted(complex_words)
+        return list(_memoized(_cached_complex_words, text, syllable_threshold))
     
     @staticmethod
     def identify_jargon_patterns(text: str) -> List[Dict[str, Any]]:
@@ -108,39 +334,16 @@ class TextAnalyzer:
         Identify potential jargon or technical language patterns.
         Uses heuristics - not demographic assumptions.
         
+        Results are memoized per text; each call returns new dicts.
+        
         Returns:
             List of potential jargon indicators
         """
-        patterns = []
-        
-        # Academic/technical patterns
-        academic_markers = [
-            r'\b(therefore|hence|thus|wherein|whereby|herein)\b',
-            r'\b(aforementioned|notwithstanding|pursuant)\b',
-            r'\b(paradigm|methodology|framework|implementation)\b',
-            r'\b(utilizing|commenced|terminated|facilitated)\b',
+        return [
+            {**pattern, "matches": list(pattern["matches"])}
+            if "matches" in pattern else dict(pattern)
+            for pattern in _memoized(_cached_jargon_patterns, text)
         ]
-        
-        for pattern in academic_markers:
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                patterns.append({
-                    "type": "academic_language",
-                    "matches": list(set(matches)),
-                    "suggestion": "Consider simpler alternatives"
-                })
-        
-        # Long sentence detection
-        sentences = re.split(r'[.!?]+', text)
-        long_sentences = [s.strip() for s in sentences if len(s.split()) > 30]
-        if long_sentences:
-            patterns.append({
-                "type": "long_sentences",
-                "count": len(long_sentences),
-                "suggestion": "Break into shorter sentences"
-            })
-        
-        return patterns
     
     @staticmethod
     def simplify_text(text: str, level: str = "moderate") -> str:
@@ -154,104 +357,75 @@ class TextAnalyzer:
         Returns:
             Simplified text
         """
-        simplified = text
-        
-        # Common academic → simple word replacements
-        replacements = {
-            "utilize": "use",
-            "implement": "do",
-            "facilitate": "help",
-            "commence": "start",
-            "terminate": "end",
-            "prior to": "before",
-            "subsequent to": "after",
-            "in order to": "to",
-            "due to the fact that": "because",
-            "at this point in time": "now",
-            "in the event that": "if",
-            "for the purpose of": "to",
-            "in addition to": "also",
-            "with regard to": "about",
-            "in accordance with": "following",
-            "nevertheless": "but",
-            "furthermore": "also",
-            "consequently": "so",
-            "approximately": "about",
-            "sufficient": "enough",
-            "demonstrate": "show",
-            "indicate": "show",
-            "obtain": "get",
-            "require": "need",
-            "assist": "help",
-            "attempt": "try",
-            "determine": "find out",
-            "establish": "set up",
-            "evaluate": "check",
-            "identify": "find",
-            "maintain": "keep",
-            "modify": "change",
-            "perform": "do",
-            "provide": "give",
-            "regarding": "about",
-            "remain": "stay",
-            "request": "ask for",
-            "select": "choose",
-            "therefore": "so",
-            "currently": "now",
-            "additional": "more",
-            "component": "part",
-            "methodology": "method",
-            "functionality": "feature",
-        }
-        
-        for complex_word, simple_word in replacements.items():
-            # Case-insensitive replacement preserving first letter case
-            pattern = re.compile(re.escape(complex_word), re.IGNORECASE)
-            simplified = pattern.sub(simple_word, simplified)
+        simplified = TextAnalyzer._REPLACEMENT_RE.sub(_replace_match, text)
         
         if level == "simple":
             # Additional simplification: break long sentences
-            sentences = re.split(r'([.!?]+)', simplified)
-            new_sentences = []
-            
-            for i, sentence in enumerate(sentences):
-                if i % 2 == 0:  # Actual sentences (not punctuation)
-                    words = sentence.split()
-                    if len(words) > 20:
-                        # Try to split at conjunctions
-                        midpoint = len(words) // 2
-                        new_sentences.append(' '.join(words[:midpoint]) + '.')
-                        new_sentences.append(' '.join(words[midpoint:]))
-                    else:
-                        new_sentences.append(sentence)
-                else:
-                    if new_sentences:
-                        new_sentences[-1] += sentence
-            
-            simplified = ' '.join(new_sentences)
+            return TextAnalyzer.break_long_sentences(simplified)
         
         return simplified.strip()
     
     @staticmethod
-    def generate_reading_time_estimate(text: str, wpm: int = 200) -> Dict[str, Any]:
+    def break_long_sentences(text: str) -> str:
+        """
+        Split sentences longer than 20 words in half.
+        
+        This is the extra step simplify_text applies at the 'simple'
+        level, so feeding it a 'moderate' result yields the 'simple' one.
+        
+        Args:
+            text: Text to restructure
+            
+        Returns:
+            Text with long sentences broken up
+        """
+        # Split yields sentence, punctuation, sentence, ..., trailing text
+        parts = TextAnalyzer._SENTENCE_KEEP_RE.split(text)
+        punctuation = parts[1::2] + ['']
+        new_sentences = []
+        
+        for sentence, punct in zip(parts[::2], punctuation):
+            words = sentence.split()
+            if len(words) > 20:
+                # Try to split at conjunctions
+                midpoint = len(words) // 2
+                new_sentences.append(' '.join(words[:midpoint]) + '.')
+                new_sentences.append(' '.join(words[midpoint:]) + punct)
+            else:
+                new_sentences.append(sentence + punct)
+        
+        return ' '.join(new_sentences).strip()
+    
+    @staticmethod
+    def generate_reading_time_estimate(
+        text: str,
+        wpm: int = 200,
+        metrics: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
         """
         Estimate reading time for content.
         
+        Word count and grade level are memoized per text.
+        
         Args:
             text: Content text
             wpm: Words per minute (default 200 for average reader)
+            metrics: Readability metrics already computed for this text,
+                whose grade level is reused instead of recomputed
             
         Returns:
             Dict with reading time estimates
         """
-        word_count = textstat.lexicon_count(text, removepunct=True)
+        word_count = _memoized(_cached_word_count, text)
+        grade = (
+            metrics["flesch_kincaid_grade"] if metrics is not None
+            else _memoized(_cached_grade_level, text)
+        )
         minutes = word_count / wpm
         
         return {
             "word_count": word_count,
             "estimated_minutes": round(minutes, 1),
             "estimated_seconds": round(minutes * 60),
-            "complexity_adjusted_minutes": round(
-                minutes * (1 + (textstat.flesch_kincaid_grade(text) / 20)), 1
-            )
+            "complexity_adjusted_minutes": round(minutes * (1 + (grade / 20)), 1)
         }